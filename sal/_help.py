@@ -0,0 +1,51 @@
+"""Help text for the sal CLI, imported only when help is shown."""
+
+HELP_TEXT = """
+USAGE:
+  sal                       Launch Claude (no MCPs, max performance)
+  sal -m <mcp>              Launch with specific MCP(s)
+  sal -m gm,at              Launch with multiple MCPs
+  sal -r, --resume          Resume last session
+  sal -l, --local           Stay in current directory (don't cd to ~/sal/desktop)
+  sal --safe                Launch without --dangerously-skip-permissions
+
+COMMANDS:
+  sal update                Update Claude Code to latest version
+  sal version, -v           Show version information
+  sal profiles              List available MCP profiles
+  sal mcp list              List all available MCPs
+  sal mcp set <profile>     Set MCP profile permanently
+  sal mcp kill              Kill orphan MCP server processes
+  sal -p "<text>"           One-shot prompt execution
+  sal prompt "<text>"       One-shot prompt execution (alt)
+  sal config                Show all configuration
+  sal config <key>          Get configuration value
+  sal config <key> <value>  Set configuration value
+  sal start-of-day          Run morning routine (once per day)
+  sal start-of-day force    Run even if already ran today
+  sal start-of-day status   Check if routine ran today
+  sal help, -h              Show this help
+
+CONFIGURATION:
+  report_email              Email address for morning reports
+  default_profile           Default MCP profile to use
+  claude_dir                Working directory for Claude
+  skip_permissions          Use --dangerously-skip-permissions (default: true)
+
+MCP SHORTCUTS:
+  gm                        Gmail
+  cal                       Google Calendar
+  at                        Airtable
+  gsh                       Google Sheets
+  doc                       Google Docs
+  drv                       Google Drive
+  gpe                       Google People
+  n8n                       n8n MCP
+  jf                        JotForm
+
+MCP PROFILES:
+  start                     Daily startup (at, gm, cal)
+  google                    All Google services (gm, cal, gsh, doc, drv, gpe)
+  dev                       Development tools (n8n, at, jf)
+  all                       All available MCPs
+"""
@@ -0,0 +1,22 @@
+"""Prompt templates for the start-of-day routine, imported only when it runs."""
+
+# Placeholders: today_formatted, today (YYYYMMDD)
+SOD_PROMPT_TEMPLATE = """Run the complete start-of-day routine. Today's date is {today_formatted}.
+
+1. Move any previous morning-report_*.md files from desktop/ to desktop/archive/
+2. Clean up completed tasks from active.md (move to archive/completed.md)
+3. Clean up ## Done column in taskell.md (move to archive/completed.md, then clear)
+4. Sync active.md and taskell.md - ensure both have same pending tasks
+5. Update active.md date header
+6. Check calendar for today and next 2 days
+7. Review emails from last day, add follow-ups to BOTH files
+8. Generate and save morning report to desktop/morning-report_{today}.md
+9. Return the report text"""
+
+# Placeholders: report_email, today_formatted, report
+SOD_EMAIL_TEMPLATE = """Send an email using the Gmail MCP with:
+- To: {report_email}
+- Subject: "Morning Report - {today_formatted}"
+- Body: The following morning report (format as HTML):
+
+{report}"""
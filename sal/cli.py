@@ -1,67 +1,44 @@
 """SAL - Claude Code Launcher CLI."""
 
-import argparse
 import sys
+from types import SimpleNamespace
 
 from . import __version__
-from .config import get_default_profile, get_report_email, load_config, save_config, set_default_profile
-from .launcher import get_claude_version, launch_claude, launch_claude_oneshot, update_claude
-from .mcp import kill_orphan_mcps, list_mcps_formatted, list_profiles_formatted
-from .shortcuts import DEFAULT_PROFILES, DEFAULT_SHORTCUTS
-
-HELP_TEXT = """
-USAGE:
-  sal                       Launch Claude (no MCPs, max performance)
-  sal -m <mcp>              Launch with specific MCP(s)
-  sal -m gm,at              Launch with multiple MCPs
-  sal -r, --resume          Resume last session
-  sal -l, --local           Stay in current directory (don't cd to ~/sal/desktop)
-  sal --safe                Launch without --dangerously-skip-permissions
-
-COMMANDS:
-  sal update                Update Claude Code to latest version
-  sal version, -v           Show version information
-  sal profiles              List available MCP profiles
-  sal mcp list              List all available MCPs
-  sal mcp set <profile>     Set MCP profile permanently
-  sal mcp kill              Kill orphan MCP server processes
-  sal -p "<text>"           One-shot prompt execution
-  sal prompt "<text>"       One-shot prompt execution (alt)
-  sal config                Show all configuration
-  sal config <key>          Get configuration value
-  sal config <key> <value>  Set configuration value
-  sal start-of-day          Run morning routine (once per day)
-  sal start-of-day force    Run even if already ran today
-  sal start-of-day status   Check if routine ran today
-  sal help, -h              Show this help
-
-CONFIGURATION:
-  report_email              Email address for morning reports
-  default_profile           Default MCP profile to use
-  claude_dir                Working directory for Claude
-  skip_permissions          Use --dangerously-skip-permissions (default: true)
-
-MCP SHORTCUTS:
-  gm                        Gmail
-  cal                       Google Calendar
-  at                        Airtable
-  gsh                       Google Sheets
-  doc                       Google Docs
-  drv                       Google Drive
-  gpe                       Google People
-  n8n                       n8n MCP
-  jf                        JotForm
-
-MCP PROFILES:
-  start                     Daily startup (at, gm, cal)
-  google                    All Google services (gm, cal, gsh, doc, drv, gpe)
-  dev                       Development tools (n8n, at, jf)
-  all                       All available MCPs
-"""
+
+# Option token -> attribute name on the parsed arguments
+FLAG_TABLE = {
+    "-m": "mcp",
+    "--mcp": "mcp",
+    "-r": "resume",
+    "--resume": "resume",
+    "-l": "local",
+    "--local": "local",
+    "--safe": "safe",
+    "-p": "prompt_text",
+    "--prompt": "prompt_text",
+    "-v": "version",
+    "--version": "version",
+    "-h": "help",
+    "--help": "help",
+}
+
+# Options that take a value; everything else in FLAG_TABLE is a switch
+VALUE_OPTIONS = frozenset({"mcp", "prompt_text"})
+
+# Commands that accept options of their own (passed through in their args)
+PASSTHROUGH_COMMANDS = frozenset({"start-of-day"})
+
+# Config values typed as literals on the command line
+_SPECIAL_VALUES = {"true": True, "false": False, "none": None}
+
+# Start-of-day marker files are named <prefix>YYYYMMDD in the SAL config dir
+SOD_FLAG_PREFIX = ".start-of-day-ran-"
 
 
 def cmd_version() -> int:
     """Show version information."""
+    from .launcher import get_claude_version
+
     print(f"SAL version: {__version__}")
     claude_version = get_claude_version()
     if claude_version:
@@ -73,27 +50,35 @@ def cmd_version() -> int:
 
 def cmd_update() -> int:
     """Update Claude Code."""
+    from .launcher import update_claude
+
     return update_claude()
 
 
 def cmd_profiles() -> int:
     """List available MCP profiles."""
+    from .mcp import list_profiles_formatted
+
     print(list_profiles_formatted())
     return 0
 
 
 def cmd_mcp_list() -> int:
     """List all available MCPs."""
+    from .mcp import list_mcps_formatted
+
     print(list_mcps_formatted())
     return 0
 
 
 def cmd_mcp_set(profile: str) -> int:
     """Set MCP profile permanently."""
-    profiles = DEFAULT_PROFILES.copy()
-    if profile not in profiles and profile != "none":
+    from .config import set_default_profile
+    from .shortcuts import DEFAULT_PROFILES
+
+    if profile not in DEFAULT_PROFILES and profile != "none":
         print(f"Error: Unknown profile '{profile}'")
-        print(f"Available profiles: {', '.join(profiles.keys())}, none")
+        print(f"Available profiles: {', '.join(DEFAULT_PROFILES.keys())}, none")
         return 1
 
     if profile == "none":
@@ -107,31 +92,40 @@ def cmd_mcp_set(profile: str) -> int:
 
 def cmd_mcp_kill() -> int:
     """Kill orphan MCP server processes."""
+    from .mcp import kill_orphan_mcps
+
     killed, messages = kill_orphan_mcps()
-    for msg in messages:
-        print(msg)
+    print("\n".join(messages))
     return 0
 
 
-def cmd_prompt(text: str, safe_mode: bool = False) -> int:
-    """Execute one-shot prompt."""
+def cmd_prompt(text: str | list[str], safe_mode: bool = False) -> int:
+    """Execute one-shot prompt (text may be given as a list of words)."""
+    from .launcher import launch_claude
+
+    # claude takes the prompt as a single -p argument
+    if not isinstance(text, str):
+        text = " ".join(text)
     return launch_claude(prompt=text, safe_mode=safe_mode)
 
 
 def cmd_help() -> int:
     """Show help."""
+    from ._help import HELP_TEXT
+
     print(HELP_TEXT.strip())
     return 0
 
 
 def cmd_config(args: list[str]) -> int:
     """Manage sal configuration."""
+    from .config import load_config, save_config
+
     config = load_config()
 
     if not args:
         # Show all config
-        for key, value in config.items():
-            print(f"{key}: {value}")
+        print("\n".join(f"{key}: {value}" for key, value in config.items()))
         return 0
 
     key = args[0]
@@ -147,12 +141,9 @@ def cmd_config(args: list[str]) -> int:
         # Set value
         value = args[1]
         # Handle special types
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        elif value.lower() == "none":
-            value = None
+        lowered = value.lower()
+        if lowered in _SPECIAL_VALUES:
+            value = _SPECIAL_VALUES[lowered]
 
         config[key] = value
         save_config(config)
@@ -163,8 +154,10 @@ def cmd_config(args: list[str]) -> int:
 
 def cmd_start_of_day(force: bool = False, status: bool = False) -> int:
     """Run the daily start-of-day routine (once per day)."""
-    import datetime
-    from pathlib import Path
+    import os
+    import time
+
+    from .config import SAL_CONFIG_DIR, ensure_config_dir, get_report_email
 
     # Check for configured email
     report_email = get_report_email()
@@ -174,39 +167,38 @@ def cmd_start_of_day(force: bool = False, status: bool = False) -> int:
         return 1
 
     # Flag file location
-    today = datetime.date.today().strftime("%Y%m%d")
-    flag_dir = Path.home() / ".sal"
-    flag_dir.mkdir(parents=True, exist_ok=True)
-    flag_file = flag_dir / f".start-of-day-ran-{today}"
+    now = time.localtime()
+    today = time.strftime("%Y%m%d", now)
+    flag_path = f"{SAL_CONFIG_DIR}{os.sep}{SOD_FLAG_PREFIX}{today}"
 
     # Status check only
     if status:
-        if flag_file.exists():
+        if os.path.exists(flag_path):
             print(f"Start-of-day routine already ran today ({today}).")
         else:
             print(f"Start-of-day routine has not run today ({today}).")
         return 0
 
+    # Full run only from here; status probes skip these imports
+    import datetime
+
+    from ._prompts import SOD_EMAIL_TEMPLATE, SOD_PROMPT_TEMPLATE
+    from .launcher import launch_claude_oneshot
+
+    flag_dir = SAL_CONFIG_DIR
+    ensure_config_dir()
+    flag_file = flag_dir / f"{SOD_FLAG_PREFIX}{today}"
+
     # Check if already ran today
     if flag_file.exists() and not force:
         print(f"Start-of-day routine already ran today. Use --force to run again.")
         return 0
 
     print("Running start-of-day routine...")
-    today_formatted = datetime.date.today().strftime("%B %d, %Y")
+    today_formatted = time.strftime("%B %d, %Y", now)
 
     # Build the start-of-day prompt
-    prompt = f"""Run the complete start-of-day routine. Today's date is {today_formatted}.
-
-1. Move any previous morning-report_*.md files from desktop/ to desktop/archive/
-2. Clean up completed tasks from active.md (move to archive/completed.md)
-3. Clean up ## Done column in taskell.md (move to archive/completed.md, then clear)
-4. Sync active.md and taskell.md - ensure both have same pending tasks
-5. Update active.md date header
-6. Check calendar for today and next 2 days
-7. Review emails from last day, add follow-ups to BOTH files
-8. Generate and save morning report to desktop/morning-report_{today}.md
-9. Return the report text"""
+    prompt = SOD_PROMPT_TEMPLATE.format(today_formatted=today_formatted, today=today)
 
     # Launch with gm,cal MCPs
     result = launch_claude_oneshot(prompt, mcps=["gm", "cal"])
@@ -220,12 +212,11 @@ def cmd_start_of_day(force: bool = False, status: bool = False) -> int:
 
     # Email the report
     print("Sending email report...")
-    email_prompt = f"""Send an email using the Gmail MCP with:
-- To: {report_email}
-- Subject: "Morning Report - {today_formatted}"
-- Body: The following morning report (format as HTML):
-
-{report}"""
+    email_prompt = SOD_EMAIL_TEMPLATE.format(
+        report_email=report_email,
+        today_formatted=today_formatted,
+        report=report,
+    )
 
     email_result = launch_claude_oneshot(email_prompt, mcps=["gm"])
 
@@ -238,15 +229,25 @@ def cmd_start_of_day(force: bool = False, status: bool = False) -> int:
     flag_file.touch()
 
     # Cleanup old flags (keep 7 days)
-    cutoff = datetime.date.today() - datetime.timedelta(days=7)
-    for old_flag in flag_dir.glob(".start-of-day-ran-*"):
-        try:
-            flag_date_str = old_flag.name.replace(".start-of-day-ran-", "")
-            flag_date = datetime.datetime.strptime(flag_date_str, "%Y%m%d").date()
-            if flag_date < cutoff:
-                old_flag.unlink()
-        except (ValueError, OSError):
-            pass  # Skip malformed or inaccessible files
+    today_date = datetime.date(now.tm_year, now.tm_mon, now.tm_mday)
+    cutoff = today_date - datetime.timedelta(days=7)
+    try:
+        with os.scandir(flag_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(SOD_FLAG_PREFIX):
+                    continue
+                try:
+                    # Slice YYYYMMDD directly; strptime is far slower
+                    s = entry.name[len(SOD_FLAG_PREFIX):]
+                    if len(s) != 8 or not s.isdigit():
+                        continue
+                    flag_date = datetime.date(int(s[0:4]), int(s[4:6]), int(s[6:8]))
+                    if flag_date < cutoff:
+                        os.unlink(entry.path)
+                except (ValueError, OSError):
+                    pass  # Skip malformed or inaccessible files
+    except OSError:
+        pass  # Cleanup is best-effort
 
     print("\nMorning routine completed!")
     print(report)
@@ -260,6 +261,9 @@ def cmd_launch(
     safe_mode: bool = False,
 ) -> int:
     """Launch Claude Code."""
+    from .config import get_default_profile
+    from .launcher import launch_claude
+
     # If no MCPs specified, check for default profile
     if mcp_arg is None:
         default_profile = get_default_profile()
@@ -274,143 +278,243 @@ def cmd_launch(
     )
 
 
-def main() -> int:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        prog="sal",
-        description="SAL - Claude Code Launcher CLI",
-        add_help=False,
+def _option_label(dest: str) -> str:
+    """Get the display form of an option, e.g. '-m/--mcp'."""
+    return "/".join(token for token, name in FLAG_TABLE.items() if name == dest)
+
+
+def _looks_like_option(token: str) -> bool:
+    """Check if a token would be read as an option rather than a value."""
+    if len(token) < 2 or token[0] != "-":
+        return False
+    if token in FLAG_TABLE:
+        return True
+    # Like argparse: negative numbers and strings with spaces are values
+    return not token[1:].replace(".", "", 1).isdigit() and " " not in token
+
+
+def _match_long_option(name: str) -> str | None:
+    """Resolve a long option or a unique prefix of one (--res -> --resume)."""
+    if name in FLAG_TABLE:
+        return name
+    matches = [token for token in FLAG_TABLE if token.startswith("--") and token.startswith(name)]
+    if len(matches) > 1:
+        raise ValueError(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else None
+
+
+def _parse_argv(argv: list[str]) -> SimpleNamespace:
+    """
+    Parse command-line tokens in a single pass.
+
+    Accepts the same forms argparse did: clustered switches (-rl), attached
+    values (-mgm, --mcp=gm) and unique long-option prefixes (--res). The
+    first positional token is the command and the remaining positionals are
+    its arguments. Unknown options are only passed through to commands in
+    PASSTHROUGH_COMMANDS (e.g. ``sal start-of-day --force``).
+
+    Returns:
+        Namespace with the same attributes argparse used to produce
+
+    Raises:
+        ValueError: If an option is unknown, ambiguous or missing its value
+    """
+    args = SimpleNamespace(
+        mcp=None,
+        resume=False,
+        local=False,
+        safe=False,
+        prompt_text=None,
+        help=False,
+        version=False,
+        command=None,
+        args=[],
     )
+    positionals: list[str] = []
+    unknown: list[str] = []
+    tokens = iter(argv)
 
-    # Launch options
-    parser.add_argument(
-        "-m", "--mcp",
-        dest="mcp",
-        metavar="MCP",
-        help="Launch with specific MCP(s), comma-separated",
-    )
-    parser.add_argument(
-        "-r", "--resume",
-        action="store_true",
-        help="Resume last session",
-    )
-    parser.add_argument(
-        "-l", "--local",
-        action="store_true",
-        help="Stay in current directory",
-    )
-    parser.add_argument(
-        "--safe",
-        action="store_true",
-        help="Launch without --dangerously-skip-permissions",
-    )
-    parser.add_argument(
-        "-p", "--prompt",
-        dest="prompt_text",
-        metavar="TEXT",
-        help="One-shot prompt execution",
-    )
-    parser.add_argument(
-        "-v", "--version",
-        action="store_true",
-        help="Show version information",
-    )
-    parser.add_argument(
-        "-h", "--help",
-        action="store_true",
-        help="Show this help",
-    )
+    def take_value(dest: str, value: str | None) -> None:
+        if value is None:
+            value = next(tokens, None)
+            if value is None or _looks_like_option(value):
+                raise ValueError(f"argument {_option_label(dest)}: expected one argument")
+        setattr(args, dest, value)
+
+    for token in tokens:
+        if token == "--":
+            positionals.extend(tokens)
+            break
+
+        if not _looks_like_option(token):
+            positionals.append(token)
+            continue
+
+        if token.startswith("--"):
+            name, inline, value = token.partition("=")
+            dest = FLAG_TABLE.get(_match_long_option(name))
+            if dest is None:
+                unknown.append(token)
+            elif dest in VALUE_OPTIONS:
+                take_value(dest, value if inline else None)
+            elif inline:
+                raise ValueError(
+                    f"argument {_option_label(dest)}: ignored explicit argument '{value}'"
+                )
+            else:
+                setattr(args, dest, True)
+            continue
+
+        # Short options: switches may be clustered (-rl) and a value option
+        # takes the rest of the token as its value (-mgm, -rmgm)
+        for i in range(1, len(token)):
+            dest = FLAG_TABLE.get(f"-{token[i]}")
+            if dest is None:
+                unknown.append(token if i == 1 else f"-{token[i:]}")
+                break
+            if dest in VALUE_OPTIONS:
+                value = token[i + 1:]
+                # argparse reads -m=gm as -m gm (but -rm=gm as -r -m =gm)
+                if i == 1 and value.startswith("="):
+                    value = value[1:]
+                take_value(dest, value or None)
+                break
+            setattr(args, dest, True)
+
+    if positionals:
+        args.command = positionals[0]
+        args.args = positionals[1:]
+
+    if unknown:
+        if args.command is None or args.command.lower() not in PASSTHROUGH_COMMANDS:
+            raise ValueError(f"unrecognized arguments: {' '.join(unknown)}")
+        args.args += unknown
+
+    return args
+
+
+def _run_mcp(rest: list[str], args: SimpleNamespace) -> int:
+    """Dispatch 'sal mcp' subcommands."""
+    if not rest:
+        return cmd_mcp_list()
+    subcmd = rest[0].lower()
+    if subcmd == "list":
+        return cmd_mcp_list()
+    if subcmd == "set":
+        if len(rest) < 2:
+            print("Error: 'mcp set' requires a profile name")
+            return 1
+        return cmd_mcp_set(rest[1])
+    if subcmd == "kill":
+        return cmd_mcp_kill()
+    print(f"Error: Unknown mcp subcommand '{subcmd}'")
+    return 1
 
-    # Subcommands as positional arguments
-    parser.add_argument(
-        "command",
-        nargs="?",
-        help="Command to run",
-    )
-    parser.add_argument(
-        "args",
-        nargs="*",
-        help="Command arguments",
-    )
 
-    args = parser.parse_args()
+def _run_prompt(rest: list[str], args: SimpleNamespace) -> int:
+    """Dispatch 'sal prompt <text>'."""
+    if not rest:
+        print("Error: 'prompt' requires text argument")
+        return 1
+    return cmd_prompt(rest, safe_mode=args.safe)
+
+
+def _run_config(rest: list[str], args: SimpleNamespace) -> int:
+    """Dispatch 'sal config [key [value]]'."""
+    return cmd_config(rest)
+
+
+def _run_start_of_day(rest: list[str], args: SimpleNamespace) -> int:
+    """Dispatch 'sal start-of-day [force|status]'."""
+    # Support both --flag and flag forms
+    force = "--force" in rest or "force" in rest
+    status = "--status" in rest or "status" in rest
+    return cmd_start_of_day(force=force, status=status)
+
+
+# Commands that take no arguments
+_COMMAND_TABLE = {
+    "help": cmd_help,
+    "version": cmd_version,
+    "update": cmd_update,
+    "profiles": cmd_profiles,
+}
+
+# Commands that receive their positional arguments and the parsed options
+_COMPLEX_COMMAND_TABLE = {
+    "mcp": _run_mcp,
+    "prompt": _run_prompt,
+    "config": _run_config,
+    "start-of-day": _run_start_of_day,
+}
+
 
-    # Handle help flag
+def _dispatch_flags(args: SimpleNamespace) -> int | None:
+    """Handle options that override any command; None means keep going."""
     if args.help:
         return cmd_help()
 
-    # Handle version flag
     if args.version:
         return cmd_version()
 
-    # Handle -p prompt flag
     if args.prompt_text:
         return cmd_prompt(args.prompt_text, safe_mode=args.safe)
 
-    # Handle commands
-    if args.command:
-        cmd = args.command.lower()
+    return None
 
-        if cmd == "help":
-            return cmd_help()
 
-        if cmd == "version":
+def _dispatch_command(cmd: str, rest: list[str], args: SimpleNamespace) -> int:
+    """Run a named command, or launch if it is a shortcut or profile."""
+    handler = _COMMAND_TABLE.get(cmd)
+    if handler:
+        return handler()
+
+    complex_handler = _COMPLEX_COMMAND_TABLE.get(cmd)
+    if complex_handler:
+        return complex_handler(rest, args)
+
+    # Unknown command - treat as potential MCP shortcut or profile
+    from .shortcuts import DEFAULT_PROFILES, DEFAULT_SHORTCUTS
+
+    if cmd in DEFAULT_SHORTCUTS or cmd in DEFAULT_PROFILES:
+        # User typed a shortcut/profile directly: sal gm
+        return cmd_launch(
+            mcp_arg=cmd,
+            resume=args.resume,
+            local_mode=args.local,
+            safe_mode=args.safe,
+        )
+
+    print(f"Error: Unknown command '{cmd}'")
+    print("Run 'sal help' for usage information.")
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main CLI entry point (argv defaults to sys.argv[1:])."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: answer help/version before any parsing
+    if argv:
+        if argv[0] in ("-h", "--help", "help"):
+            return cmd_help()
+        if argv[0] in ("-v", "--version", "version"):
             return cmd_version()
 
-        if cmd == "update":
-            return cmd_update()
-
-        if cmd == "profiles":
-            return cmd_profiles()
-
-        if cmd == "mcp":
-            if not args.args:
-                return cmd_mcp_list()
-            subcmd = args.args[0].lower()
-            if subcmd == "list":
-                return cmd_mcp_list()
-            if subcmd == "set":
-                if len(args.args) < 2:
-                    print("Error: 'mcp set' requires a profile name")
-                    return 1
-                return cmd_mcp_set(args.args[1])
-            if subcmd == "kill":
-                return cmd_mcp_kill()
-            print(f"Error: Unknown mcp subcommand '{subcmd}'")
-            return 1
+    try:
+        args = _parse_argv(argv)
+    except ValueError as e:
+        print(f"sal: error: {e}", file=sys.stderr)
+        print("Run 'sal help' for usage information.", file=sys.stderr)
+        return 2
 
-        if cmd == "prompt":
-            if not args.args:
-                print("Error: 'prompt' requires text argument")
-                return 1
-            text = " ".join(args.args)
-            return cmd_prompt(text, safe_mode=args.safe)
-
-        if cmd == "config":
-            return cmd_config(args.args)
-
-        if cmd == "start-of-day":
-            # Parse start-of-day specific flags (support both --flag and flag forms)
-            force = "--force" in args.args or "force" in args.args
-            status = "--status" in args.args or "status" in args.args
-            return cmd_start_of_day(force=force, status=status)
-
-        # Unknown command - treat as potential MCP shortcut or profile
-        shortcuts = DEFAULT_SHORTCUTS.copy()
-        profiles = DEFAULT_PROFILES.copy()
-
-        if cmd in shortcuts or cmd in profiles:
-            # User typed a shortcut/profile directly: sal gm
-            return cmd_launch(
-                mcp_arg=cmd,
-                resume=args.resume,
-                local_mode=args.local,
-                safe_mode=args.safe,
-            )
-
-        print(f"Error: Unknown command '{cmd}'")
-        print("Run 'sal help' for usage information.")
-        return 1
+    result = _dispatch_flags(args)
+    if result is not None:
+        return result
+
+    if args.command:
+        return _dispatch_command(args.command.lower(), args.args, args)
 
     # Default: launch claude
     return cmd_launch(
@@ -1,10 +1,31 @@
 """Configuration management for SAL."""
 
+import copy
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from .shortcuts import DEFAULT_PROFILES, DEFAULT_SHORTCUTS
 
+# orjson is optional (pip install sal[fast]); it parses and serializes
+# SAL's own config files faster than the stdlib json module. ~/.claude.json
+# always uses stdlib json: orjson rejects lone surrogate escapes and NaN and
+# turns integers above 64 bits into floats, all of which must round-trip.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data: dict | list) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data: dict | list) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 # Configuration directory
 SAL_CONFIG_DIR = Path.home() / ".sal"
 CONFIG_FILE = SAL_CONFIG_DIR / "config.json"
@@ -15,6 +36,13 @@ MCP_CONFIG_FILE = SAL_CONFIG_DIR / "mcp.json"
 # Claude Code configuration file
 CLAUDE_CONFIG_FILE = Path.home() / ".claude.json"
 
+# Set once SAL_CONFIG_DIR is known to exist, so saves skip the mkdir
+_config_dir_ensured = False
+
+# Shared SAL config read by the getters, and the stat key it was loaded at
+_config: dict | None = None
+_config_key: tuple[int, int] | None = None
+
 # Default configuration values
 DEFAULT_CONFIG = {
     "default_profile": None,
@@ -105,24 +133,44 @@ DEFAULT_MCP_SERVERS = {
 }
 
 
+@lru_cache(maxsize=32)
+def _resolved(path: str) -> Path:
+    """Expand ~ and resolve a path; memoized since realpath stats every component."""
+    return Path(path).expanduser().resolve()
+
+
 def ensure_config_dir() -> None:
     """Create the SAL config directory if it doesn't exist."""
+    global _config_dir_ensured
+    if _config_dir_ensured:
+        return
     SAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _config_dir_ensured = True
+
+
+def _stat_key(filepath: Path) -> tuple[int, int] | None:
+    """Get a file's (st_mtime_ns, st_size), or None if it doesn't exist."""
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
-def load_json_file(filepath: Path, default: dict | list) -> dict | list:
+def load_json_file(filepath: Path, default: dict | list | None) -> dict | list | None:
     """Load a JSON file, returning default if file doesn't exist."""
-    if filepath.exists():
-        with open(filepath) as f:
-            return json.load(f)
-    return default
+    # Each file is loaded once per launch and shared from there (see
+    # ConfigBundle and _get_config), so there is nothing to cache here
+    try:
+        return _loads(filepath.read_bytes())
+    except FileNotFoundError:
+        return default
 
 
 def save_json_file(filepath: Path, data: dict | list) -> None:
     """Save data to a JSON file."""
     ensure_config_dir()
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+    filepath.write_bytes(_dumps(data))
 
 
 def load_config() -> dict:
@@ -135,17 +183,33 @@ def load_config() -> dict:
     return config
 
 
+def _get_config() -> dict:
+    """
+    Get the shared SAL configuration, reloading only when config.json changes.
+
+    The returned dict is shared by every getter in this process; only the
+    setters in this module modify it.
+    """
+    global _config, _config_key
+    key = _stat_key(CONFIG_FILE)
+    if _config is None or key != _config_key:
+        _config = load_config()
+        _config_key = key
+    return _config
+
+
 def save_config(config: dict) -> None:
-    """Save the main SAL configuration."""
+    """Save the main SAL configuration (it becomes the shared config)."""
+    global _config, _config_key
     save_json_file(CONFIG_FILE, config)
+    _config = config
+    _config_key = _stat_key(CONFIG_FILE)
 
 
 def load_shortcuts() -> dict[str, str]:
     """Load MCP shortcuts, merging user overrides with defaults."""
     user_shortcuts = load_json_file(SHORTCUTS_FILE, {})
-    shortcuts = DEFAULT_SHORTCUTS.copy()
-    shortcuts.update(user_shortcuts)
-    return shortcuts
+    return {**DEFAULT_SHORTCUTS, **user_shortcuts}
 
 
 def save_shortcuts(shortcuts: dict[str, str]) -> None:
@@ -156,9 +220,7 @@ def save_shortcuts(shortcuts: dict[str, str]) -> None:
 def load_profiles() -> dict[str, list[str]]:
     """Load MCP profiles, merging user overrides with defaults."""
     user_profiles = load_json_file(PROFILES_FILE, {})
-    profiles = DEFAULT_PROFILES.copy()
-    profiles.update(user_profiles)
-    return profiles
+    return {**DEFAULT_PROFILES, **user_profiles}
 
 
 def save_profiles(profiles: dict[str, list[str]]) -> None:
@@ -174,8 +236,13 @@ def init_mcp_config() -> None:
 
 def load_mcp_config() -> dict:
     """Load the MCP configuration, initializing with defaults if needed."""
-    init_mcp_config()
-    return load_json_file(MCP_CONFIG_FILE, DEFAULT_MCP_SERVERS)
+    # Load first and only write defaults when the file is missing, instead
+    # of an exists() check followed by a second lookup of the same path
+    try:
+        return _loads(MCP_CONFIG_FILE.read_bytes())
+    except FileNotFoundError:
+        save_json_file(MCP_CONFIG_FILE, DEFAULT_MCP_SERVERS)
+        return copy.deepcopy(DEFAULT_MCP_SERVERS)
 
 
 def save_mcp_config(config: dict) -> None:
@@ -189,62 +256,157 @@ def get_mcp_config_path() -> Path:
     return MCP_CONFIG_FILE
 
 
-def get_claude_dir() -> Path:
-    """Get the Claude working directory."""
-    config = load_config()
-    return Path(config["claude_dir"]).expanduser()
+def get_claude_dir(config: dict | None = None) -> Path:
+    """Get the Claude working directory (from config if already loaded)."""
+    if config is None:
+        config = _get_config()
+    return _resolved(config["claude_dir"])
 
 
-def get_default_profile() -> str | None:
+def get_default_profile(config: dict | None = None) -> str | None:
     """Get the default MCP profile, if set."""
-    config = load_config()
+    if config is None:
+        config = _get_config()
     return config.get("default_profile")
 
 
 def set_default_profile(profile: str | None) -> None:
     """Set the default MCP profile."""
-    config = load_config()
+    config = _get_config()
     config["default_profile"] = profile
     save_config(config)
 
 
-def should_skip_permissions() -> bool:
+def should_skip_permissions(config: dict | None = None) -> bool:
     """Check if we should use --dangerously-skip-permissions by default."""
-    config = load_config()
+    if config is None:
+        config = _get_config()
     return config.get("skip_permissions", True)
 
 
-def get_report_email() -> str | None:
+def get_report_email(config: dict | None = None) -> str | None:
     """Get configured email for morning reports."""
-    config = load_config()
+    if config is None:
+        config = _get_config()
     return config.get("report_email")
 
 
 def set_report_email(email: str) -> None:
     """Set email address for morning reports."""
-    config = load_config()
+    config = _get_config()
     config["report_email"] = email
     save_config(config)
 
 
+def _read_claude_config() -> dict | None:
+    """Read ~/.claude.json: {} if it doesn't exist, None if it can't be parsed."""
+    try:
+        config = json.loads(CLAUDE_CONFIG_FILE.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (ValueError, OSError):
+        return None
+    return config if isinstance(config, dict) else None
+
+
 def load_claude_config() -> dict:
     """Load the Claude Code configuration from ~/.claude.json."""
-    if CLAUDE_CONFIG_FILE.exists():
-        try:
-            with open(CLAUDE_CONFIG_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    config = _read_claude_config()
+    return {} if config is None else config
 
 
 def save_claude_config(config: dict) -> None:
-    """Save the Claude Code configuration to ~/.claude.json."""
-    with open(CLAUDE_CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    """
+    Save the Claude Code configuration to ~/.claude.json.
 
+    The data is written in one go to a temporary sibling file and renamed
+    over the original, so a crash mid-write can't leave Claude with a
+    truncated config.
+    """
+    # Resolve so a symlinked ~/.claude.json keeps its link
+    target = CLAUDE_CONFIG_FILE.resolve()
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(json.dumps(config, indent=2).encode())
+        if target.exists():
+            os.chmod(tmp, target.stat().st_mode & 0o7777)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Marks a ConfigBundle source that hasn't been read yet
+_NOT_LOADED = object()
+
+
+class ConfigBundle:
+    """
+    Every configuration source a launch needs, loaded once and passed down.
 
-def set_project_mcp_servers(project_path: Path, enabled_servers: list[str]) -> None:
+    Only config.json is read up front; the other files are read on first
+    access, so a launch without -m never parses shortcuts or profiles.
+    """
+
+    __slots__ = ("config", "_mcp_servers", "_shortcuts", "_profiles", "_claude_config")
+
+    def __init__(self, config: dict) -> None:
+        self.config = config
+        self._mcp_servers: dict | None = None
+        self._shortcuts: dict[str, str] | None = None
+        self._profiles: dict[str, list[str]] | None = None
+        self._claude_config: dict | None | object = _NOT_LOADED
+
+    @property
+    def claude_dir(self) -> Path:
+        """The Claude working directory."""
+        return get_claude_dir(self.config)
+
+    @property
+    def skip_permissions(self) -> bool:
+        """Whether to use --dangerously-skip-permissions by default."""
+        return should_skip_permissions(self.config)
+
+    @property
+    def mcp_servers(self) -> dict:
+        """Master MCP server definitions from mcp.json."""
+        if self._mcp_servers is None:
+            self._mcp_servers = load_mcp_config().get("mcpServers", {})
+        return self._mcp_servers
+
+    @property
+    def shortcuts(self) -> dict[str, str]:
+        """MCP shortcuts, user overrides merged with defaults."""
+        if self._shortcuts is None:
+            self._shortcuts = load_shortcuts()
+        return self._shortcuts
+
+    @property
+    def profiles(self) -> dict[str, list[str]]:
+        """MCP profiles, user overrides merged with defaults."""
+        if self._profiles is None:
+            self._profiles = load_profiles()
+        return self._profiles
+
+    @property
+    def claude_config(self) -> dict | None:
+        """The Claude Code configuration from ~/.claude.json (None if unparseable)."""
+        if self._claude_config is _NOT_LOADED:
+            self._claude_config = _read_claude_config()
+        return self._claude_config
+
+
+def load_config_bundle() -> ConfigBundle:
+    """Load SAL config; the other sources load when first used."""
+    return ConfigBundle(_get_config())
+
+
+def set_project_mcp_servers(
+    project_path: Path,
+    enabled_servers: list[str],
+    all_servers: dict | None = None,
+    claude_config: dict | None = None,
+) -> bool:
     """
     Set the enabled MCP servers for a project in ~/.claude.json.
 
@@ -258,28 +420,37 @@ def set_project_mcp_servers(project_path: Path, enabled_servers: list[str]) -> N
     Args:
         project_path: The project directory path
         enabled_servers: List of server names to enable (auto-start).
+        all_servers: Master MCP server definitions (loaded if None)
+        claude_config: Contents of ~/.claude.json (loaded if None)
+
+    Returns:
+        False if ~/.claude.json exists but can't be parsed; it is left
+        untouched rather than overwritten with only SAL's entries.
     """
-    # Load the master MCP config to get ALL server definitions
-    mcp_config = load_mcp_config()
-    all_servers = mcp_config.get("mcpServers", {})
+    # Load the Claude config first, so an unreadable one stops the sync early
+    if claude_config is None:
+        claude_config = _read_claude_config()
+        if claude_config is None:
+            return False
 
-    # ALL servers go into mcpServers (makes them all AVAILABLE)
-    all_server_configs = {}
-    for server_name, server_config in all_servers.items():
-        all_server_configs[server_name] = server_config.copy()
+    # Load the master MCP config to get ALL server definitions
+    if all_servers is None:
+        all_servers = load_mcp_config().get("mcpServers", {})
 
-    # Load and update Claude config
-    claude_config = load_claude_config()
+    # ALL servers go into mcpServers (makes them all AVAILABLE). The server
+    # dicts are only serialized, never mutated, so they are shared as-is.
+    all_server_configs = dict(all_servers)
 
     # Ensure projects dict exists
     if "projects" not in claude_config:
         claude_config["projects"] = {}
 
     # Get absolute path as string (how Claude stores project keys)
-    project_key = str(project_path.expanduser().resolve())
+    project_key = str(_resolved(str(project_path)))
 
     # Initialize project entry if it doesn't exist
-    if project_key not in claude_config["projects"]:
+    is_new_project = project_key not in claude_config["projects"]
+    if is_new_project:
         claude_config["projects"][project_key] = {
             "allowedTools": [],
             "mcpContextUris": [],
@@ -292,30 +463,30 @@ def set_project_mcp_servers(project_path: Path, enabled_servers: list[str]) -> N
 
     project = claude_config["projects"][project_key]
 
-    # Put ALL servers in mcpServers (all are AVAILABLE)
-    project["mcpServers"] = all_server_configs
-
     # Build disabledMcpServers list:
     # - Servers NOT in enabled_servers go here (available but won't auto-start)
     # - Servers IN enabled_servers are removed (will auto-start)
+    # - Disabled servers SAL doesn't know about are kept (plugin servers etc.)
     enabled_set = set(enabled_servers)
+    existing_disabled = set(project.get("disabledMcpServers", []))
+    all_names = all_servers.keys()
+    disabled_servers = (existing_disabled - all_names) | (all_names - enabled_set)
+
+    # Skip rewriting ~/.claude.json (often megabytes) when nothing changed
+    if (
+        not is_new_project
+        and project.get("mcpServers") == all_server_configs
+        and existing_disabled == disabled_servers
+    ):
+        return True
 
-    # Start with existing disabled servers (preserve plugin servers etc.)
-    disabled_servers = set(project.get("disabledMcpServers", []))
-
-    # Remove all our known servers first, then add back the disabled ones
-    for server_name in all_servers:
-        disabled_servers.discard(server_name)
-
-    # Add back only the servers that should be DISABLED (not in enabled list)
-    for server_name in all_servers:
-        if server_name not in enabled_set:
-            disabled_servers.add(server_name)
-
-    project["disabledMcpServers"] = list(disabled_servers)
+    # Put ALL servers in mcpServers (all are AVAILABLE)
+    project["mcpServers"] = all_server_configs
+    project["disabledMcpServers"] = sorted(disabled_servers)
 
     # Save the updated config
     save_claude_config(claude_config)
+    return True
 
 
 def get_project_mcp_servers(project_path: Path) -> dict:
@@ -329,7 +500,7 @@ def get_project_mcp_servers(project_path: Path) -> dict:
         Dict of server name -> server config
     """
     claude_config = load_claude_config()
-    project_key = str(project_path.expanduser().resolve())
+    project_key = str(_resolved(str(project_path)))
     projects = claude_config.get("projects", {})
     project = projects.get(project_key, {})
     return project.get("mcpServers", {})
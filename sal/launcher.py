@@ -5,15 +5,21 @@ import subprocess
 import sys
 from pathlib import Path
 
-from .config import get_claude_dir, set_project_mcp_servers, should_skip_permissions
+from .config import ConfigBundle, load_config_bundle, set_project_mcp_servers
 from .mcp import parse_mcp_arg, validate_servers
 
+# Shown when ~/.claude.json exists but can't be parsed, so MCPs aren't synced
+_UNREADABLE_CLAUDE_CONFIG = (
+    "Warning: ~/.claude.json could not be parsed; MCP servers were not updated."
+)
+
 
 def build_claude_command(
     mcp_arg: str | None = None,
     resume: bool = False,
     safe_mode: bool = False,
     prompt: str | None = None,
+    bundle: ConfigBundle | None = None,
 ) -> tuple[list[str], list[str], str | None]:
     """
     Build the claude command with appropriate flags.
@@ -23,10 +29,14 @@ def build_claude_command(
         resume: Whether to resume last session
         safe_mode: If True, don't use --dangerously-skip-permissions
         prompt: One-shot prompt text
+        bundle: Configuration loaded for this launch (loaded if None)
 
     Returns:
         Tuple of (command_list, enabled_servers, error_message)
     """
+    if bundle is None:
+        bundle = load_config_bundle()
+
     cmd = ["claude"]
     enabled_servers: list[str] = []
 
@@ -37,8 +47,8 @@ def build_claude_command(
     # Handle MCP configuration
     # Parse and validate requested servers - these will be set in ~/.claude.json
     if mcp_arg:
-        servers = parse_mcp_arg(mcp_arg)
-        valid, invalid = validate_servers(servers)
+        servers = parse_mcp_arg(mcp_arg, bundle.shortcuts, bundle.profiles)
+        valid, invalid = validate_servers(servers, bundle.mcp_servers.keys())
 
         if invalid:
             return [], [], f"Unknown MCP servers: {', '.join(invalid)}"
@@ -46,7 +56,7 @@ def build_claude_command(
         enabled_servers = valid
 
     # Handle permissions flag
-    if not safe_mode and should_skip_permissions():
+    if not safe_mode and bundle.skip_permissions:
         cmd.append("--dangerously-skip-permissions")
 
     # Handle one-shot prompt
@@ -76,11 +86,14 @@ def launch_claude(
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    # Load every config source this launch needs once
+    bundle = load_config_bundle()
+
     # Determine the working directory
     if local_mode:
         claude_dir = Path.cwd()
     else:
-        claude_dir = get_claude_dir()
+        claude_dir = bundle.claude_dir
         claude_dir.mkdir(parents=True, exist_ok=True)
 
     # Build command and get enabled servers
@@ -89,6 +102,7 @@ def launch_claude(
         resume=resume,
         safe_mode=safe_mode,
         prompt=prompt,
+        bundle=bundle,
     )
 
     if error:
@@ -97,7 +111,10 @@ def launch_claude(
 
     # Update ~/.claude.json with the enabled MCP servers for this project
     # This is how Claude Code determines which servers to start
-    set_project_mcp_servers(claude_dir, enabled_servers)
+    if not set_project_mcp_servers(
+        claude_dir, enabled_servers, bundle.mcp_servers, bundle.claude_config
+    ):
+        print(_UNREADABLE_CLAUDE_CONFIG, file=sys.stderr)
 
     # Change to the target directory
     if not local_mode:
@@ -173,7 +190,8 @@ def launch_claude_oneshot(
         subprocess.CompletedProcess with stdout/stderr captured
     """
     # Get working directory
-    claude_dir = get_claude_dir()
+    bundle = load_config_bundle()
+    claude_dir = bundle.claude_dir
     claude_dir.mkdir(parents=True, exist_ok=True)
 
     # Build MCP argument if provided
@@ -185,6 +203,7 @@ def launch_claude_oneshot(
         resume=False,
         safe_mode=safe_mode,
         prompt=prompt,
+        bundle=bundle,
     )
 
     if error:
@@ -197,7 +216,10 @@ def launch_claude_oneshot(
         )
 
     # Configure MCPs in ~/.claude.json
-    set_project_mcp_servers(claude_dir, enabled_servers)
+    if not set_project_mcp_servers(
+        claude_dir, enabled_servers, bundle.mcp_servers, bundle.claude_config
+    ):
+        print(_UNREADABLE_CLAUDE_CONFIG, file=sys.stderr)
 
     # Execute and capture output
     try:
@@ -1,35 +1,52 @@
 """MCP server configuration handling."""
 
 import json
-import os
-import signal
-import subprocess
-import tempfile
+from collections.abc import Collection
 from pathlib import Path
 
-from .config import load_mcp_config, load_profiles, load_shortcuts
+from .config import (
+    SHORTCUTS_FILE,
+    load_json_file,
+    load_mcp_config,
+    load_profiles,
+    load_shortcuts,
+)
+from .shortcuts import DEFAULT_REVERSE_SHORTCUTS, DEFAULT_SHORTCUTS
 
+# Set once the temp config directory is known to exist
+_temp_dir_ensured = False
 
-def get_available_servers() -> list[str]:
-    """Get list of available MCP server names from config."""
-    config = load_mcp_config()
-    return list(config.get("mcpServers", {}).keys())
+
+def get_available_servers() -> Collection[str]:
+    """Get the available MCP server names from config."""
+    return load_mcp_config().get("mcpServers", {}).keys()
 
 
-def resolve_shortcut(shortcut: str) -> str:
+def resolve_shortcut(shortcut: str, shortcuts: dict[str, str] | None = None) -> str:
     """Resolve a shortcut to its full server name."""
-    shortcuts = load_shortcuts()
+    if shortcuts is None:
+        shortcuts = load_shortcuts()
     return shortcuts.get(shortcut, shortcut)
 
 
-def resolve_profile(profile_name: str) -> list[str]:
+def resolve_profile(
+    profile_name: str,
+    profiles: dict[str, list[str]] | None = None,
+    shortcuts: dict[str, str] | None = None,
+) -> list[str]:
     """Resolve a profile name to list of server names."""
-    profiles = load_profiles()
-    shortcuts = profiles.get(profile_name, [])
-    return [resolve_shortcut(s) for s in shortcuts]
-
-
-def parse_mcp_arg(mcp_arg: str) -> list[str]:
+    if profiles is None:
+        profiles = load_profiles()
+    if shortcuts is None:
+        shortcuts = load_shortcuts()
+    return [shortcuts.get(s, s) for s in profiles.get(profile_name, [])]
+
+
+def parse_mcp_arg(
+    mcp_arg: str,
+    shortcuts: dict[str, str] | None = None,
+    profiles: dict[str, list[str]] | None = None,
+) -> list[str]:
     """
     Parse the -m argument into a list of server names.
 
@@ -38,8 +55,14 @@ def parse_mcp_arg(mcp_arg: str) -> list[str]:
     - Multiple shortcuts: "gm,at" -> ["gmail", "airtable"]
     - Profile names: "google" -> ["gmail", "google-calendar", ...]
     - Full server names: "gmail" -> ["gmail"]
+
+    Preloaded shortcuts/profiles may be passed in; otherwise they are loaded
+    once here and every item resolves against them.
     """
-    profiles = load_profiles()
+    if shortcuts is None:
+        shortcuts = load_shortcuts()
+    if profiles is None:
+        profiles = load_profiles()
     servers = []
 
     for item in mcp_arg.split(","):
@@ -49,30 +72,31 @@ def parse_mcp_arg(mcp_arg: str) -> list[str]:
 
         # Check if it's a profile name
         if item in profiles:
-            servers.extend(resolve_profile(item))
+            servers.extend(shortcuts.get(s, s) for s in profiles[item])
         else:
             # Resolve as shortcut or use as-is
-            servers.append(resolve_shortcut(item))
+            servers.append(shortcuts.get(item, item))
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_servers = []
-    for s in servers:
-        if s not in seen:
-            seen.add(s)
-            unique_servers.append(s)
-
-    return unique_servers
+    return list(dict.fromkeys(servers))
 
 
-def validate_servers(server_names: list[str]) -> tuple[list[str], list[str]]:
+def validate_servers(
+    server_names: list[str],
+    available: Collection[str] | None = None,
+) -> tuple[list[str], list[str]]:
     """
     Validate that requested servers exist in the MCP config.
 
+    Args:
+        server_names: Server names to check
+        available: Known server names (read from the MCP config if None)
+
     Returns:
         Tuple of (valid_servers, invalid_servers)
     """
-    available = set(get_available_servers())
+    if available is None:
+        available = get_available_servers()
     valid = []
     invalid = []
 
@@ -99,6 +123,8 @@ def generate_mcp_config(enabled_servers: list[str] | None = None) -> Path:
     Returns:
         Path to the temporary config file
     """
+    import tempfile
+
     master_config = load_mcp_config()
     all_servers = master_config.get("mcpServers", {})
 
@@ -122,8 +148,11 @@ def generate_mcp_config(enabled_servers: list[str] | None = None) -> Path:
     full_config = {"mcpServers": configured_servers}
 
     # Write to temporary file
+    global _temp_dir_ensured
     temp_dir = Path(tempfile.gettempdir()) / "sal"
-    temp_dir.mkdir(exist_ok=True)
+    if not _temp_dir_ensured:
+        temp_dir.mkdir(exist_ok=True)
+        _temp_dir_ensured = True
     temp_file = temp_dir / "mcp_config.json"
 
     with open(temp_file, "w") as f:
@@ -134,37 +163,29 @@ def generate_mcp_config(enabled_servers: list[str] | None = None) -> Path:
 
 def list_mcps_formatted() -> str:
     """Generate formatted list of available MCPs."""
-    shortcuts = load_shortcuts()
-    available = set(get_available_servers())
+    available = get_available_servers()
 
-    # Build reverse mapping: server name -> shortcut
-    reverse_shortcuts = {v: k for k, v in shortcuts.items()}
+    # Reverse mapping: server name -> shortcut (precomputed unless overridden)
+    user_shortcuts = load_json_file(SHORTCUTS_FILE, None)
+    if user_shortcuts is None:
+        reverse_shortcuts = DEFAULT_REVERSE_SHORTCUTS
+    else:
+        shortcuts = {**DEFAULT_SHORTCUTS, **user_shortcuts}
+        reverse_shortcuts = {v: k for k, v in shortcuts.items()}
 
-    lines = ["Available MCP Servers:", ""]
-
-    for server in sorted(available):
-        shortcut = reverse_shortcuts.get(server, "")
-        if shortcut:
-            lines.append(f"  {shortcut:<8} {server}")
-        else:
-            lines.append(f"  {'':8} {server}")
-
-    return "\n".join(lines)
+    return "Available MCP Servers:\n\n" + "\n".join(
+        f"  {reverse_shortcuts.get(server, ''):<8} {server}" for server in sorted(available)
+    )
 
 
 def list_profiles_formatted() -> str:
     """Generate formatted list of MCP profiles."""
     profiles = load_profiles()
 
-    lines = ["MCP Profiles:", ""]
-
-    for profile, shortcuts in sorted(profiles.items()):
-        servers = ", ".join(shortcuts)
-        lines.append(f"  {profile}")
-        lines.append(f"    {servers}")
-        lines.append("")
-
-    return "\n".join(lines)
+    return "MCP Profiles:\n\n" + "\n".join(
+        f"  {profile}\n    {', '.join(shortcuts)}\n"
+        for profile, shortcuts in sorted(profiles.items())
+    )
 
 
 def get_mcp_server_paths() -> list[str]:
@@ -183,43 +204,57 @@ def find_orphan_mcp_processes() -> list[tuple[int, str]]:
     """
     Find running MCP server processes.
 
+    Lists every process with a single ps call and matches all server paths
+    with one compiled pattern, rather than running pgrep and ps per server.
+    This process and its ancestors (e.g. the invoking shell, whose command
+    line may mention a server path) are never reported, as pgrep does.
+
     Returns:
         List of (pid, command) tuples for running MCP processes.
     """
-    orphans = []
-    server_paths = get_mcp_server_paths()
+    import os
+    import re
+    import subprocess
 
-    for path in server_paths:
+    server_paths = get_mcp_server_paths()
+    if not server_paths:
+        return []
+
+    pattern = re.compile("|".join(re.escape(path) for path in server_paths))
+
+    try:
+        result = subprocess.run(
+            ["ps", "-Ao", "pid=,ppid=,command="],
+            capture_output=True,
+            text=True,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return []
+    if result.returncode != 0:
+        return []
+
+    parents: dict[int, int] = {}
+    matches = []
+    for line in result.stdout.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) < 3:
+            continue
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", path],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                for pid_str in result.stdout.strip().split("\n"):
-                    if pid_str:
-                        pid = int(pid_str)
-                        # Get the command for display
-                        ps_result = subprocess.run(
-                            ["ps", "-p", str(pid), "-o", "command="],
-                            capture_output=True,
-                            text=True,
-                        )
-                        cmd = ps_result.stdout.strip() if ps_result.returncode == 0 else path
-                        orphans.append((pid, cmd))
-        except (subprocess.SubprocessError, ValueError):
+            pid, ppid = int(fields[0]), int(fields[1])
+        except ValueError:
             continue
+        parents[pid] = ppid
+        if pattern.search(fields[2]):
+            matches.append((pid, fields[2].strip()))
 
-    # Remove duplicates (same PID might match multiple patterns)
-    seen_pids = set()
-    unique_orphans = []
-    for pid, cmd in orphans:
-        if pid not in seen_pids:
-            seen_pids.add(pid)
-            unique_orphans.append((pid, cmd))
+    # Walk up from this process so it and its ancestors are skipped
+    own = set()
+    pid = os.getpid()
+    while pid > 0 and pid not in own:
+        own.add(pid)
+        pid = parents.get(pid, 0)
 
-    return unique_orphans
+    return [(pid, cmd) for pid, cmd in matches if pid not in own]
 
 
 def kill_orphan_mcps() -> tuple[int, list[str]]:
@@ -229,6 +264,9 @@ def kill_orphan_mcps() -> tuple[int, list[str]]:
     Returns:
         Tuple of (killed_count, list of status messages).
     """
+    import os
+    import signal
+
     orphans = find_orphan_mcp_processes()
 
     if not orphans:
@@ -1,7 +1,10 @@
 """MCP shortcut definitions and profile mappings."""
 
-# Default shortcut mappings: short code -> full MCP server name
-DEFAULT_SHORTCUTS: dict[str, str] = {
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Default shortcut mappings: short code -> full MCP server name (read-only)
+DEFAULT_SHORTCUTS: Mapping[str, str] = MappingProxyType({
     "gm": "gmail",
     "cal": "google-calendar",
     "at": "airtable",
@@ -11,29 +14,31 @@ DEFAULT_SHORTCUTS: dict[str, str] = {
     "gpe": "google-people",
     "n8n": "n8n",
     "jf": "jotform",
-}
+})
+
+# Reverse of DEFAULT_SHORTCUTS: full MCP server name -> short code
+DEFAULT_REVERSE_SHORTCUTS: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in DEFAULT_SHORTCUTS.items()}
+)
 
-# Default profile definitions: profile name -> list of shortcuts
-DEFAULT_PROFILES: dict[str, list[str]] = {
+# Default profile definitions: profile name -> list of shortcuts (read-only)
+DEFAULT_PROFILES: Mapping[str, list[str]] = MappingProxyType({
     "start": ["at", "gm", "cal"],
     "google": ["gm", "cal", "gsh", "doc", "drv", "gpe"],
     "dev": ["n8n", "at", "jf"],
     "all": ["gm", "cal", "at", "gsh", "doc", "drv", "gpe", "n8n", "jf"],
-}
+})
 
 
 def get_shortcut_help() -> str:
     """Generate help text for MCP shortcuts."""
-    lines = ["MCP SHORTCUTS:"]
-    for shortcut, server in DEFAULT_SHORTCUTS.items():
-        lines.append(f"  {shortcut:<20} {server}")
-    return "\n".join(lines)
+    return "MCP SHORTCUTS:\n" + "\n".join(
+        f"  {shortcut:<20} {server}" for shortcut, server in DEFAULT_SHORTCUTS.items()
+    )
 
 
 def get_profile_help() -> str:
     """Generate help text for MCP profiles."""
-    lines = ["MCP PROFILES:"]
-    for profile, shortcuts in DEFAULT_PROFILES.items():
-        mcps = ", ".join(shortcuts)
-        lines.append(f"  {profile:<20} {mcps}")
-    return "\n".join(lines)
+    return "MCP PROFILES:\n" + "\n".join(
+        f"  {profile:<20} {', '.join(shortcuts)}" for profile, shortcuts in DEFAULT_PROFILES.items()
+    )
@@ -0,0 +1,106 @@
+"""Parity tests for the argv parser against the argparse setup it replaced."""
+
+import argparse
+import contextlib
+import io
+import unittest
+from types import SimpleNamespace
+
+from sal.cli import _parse_argv
+
+
+def _argparse_parser() -> argparse.ArgumentParser:
+    """The argparse parser sal used before _parse_argv."""
+    parser = argparse.ArgumentParser(prog="sal", add_help=False)
+    parser.add_argument("-m", "--mcp", dest="mcp")
+    parser.add_argument("-r", "--resume", action="store_true")
+    parser.add_argument("-l", "--local", action="store_true")
+    parser.add_argument("--safe", action="store_true")
+    parser.add_argument("-p", "--prompt", dest="prompt_text")
+    parser.add_argument("-v", "--version", action="store_true")
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("command", nargs="?")
+    parser.add_argument("args", nargs="*")
+    return parser
+
+
+def _argparse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse with argparse, or None if it rejects the input."""
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return SimpleNamespace(**vars(_argparse_parser().parse_args(argv)))
+    except SystemExit:
+        return None
+
+
+def _parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse with _parse_argv, or None if it rejects the input."""
+    try:
+        return _parse_argv(argv)
+    except ValueError:
+        return None
+
+
+ACCEPTED = [
+    [],
+    ["gm"],
+    ["-m", "gm"],
+    ["-mgm"],
+    ["-m=gm"],
+    ["-p=x"],
+    ["-rm=gm"],
+    ["--mcp=gm,cal"],
+    ["-rl"],
+    ["-lr"],
+    ["-rmgm"],
+    ["-lm", "gm"],
+    ["--res"],
+    ["--loc"],
+    ["--pro", "x"],
+    ["--pro=x"],
+    ["-p", "-"],
+    ["-p", "-1"],
+    ["-p", "-do this"],
+    ["-r", "gm", "--safe"],
+    ["gm", "-r"],
+    ["mcp", "set", "work"],
+    ["config", "claude_dir", "~/x"],
+    ["prompt", "hello", "world"],
+    ["--", "-r"],
+    ["-"],
+]
+
+REJECTED = [
+    ["-x"],
+    ["-rx"],
+    ["--bogus"],
+    ["gm", "--bogus"],
+    ["config", "--bogus"],
+    ["-m"],
+    ["-m", "-r"],
+    ["--resume=yes"],
+]
+
+
+class ParseArgvParityTest(unittest.TestCase):
+    def test_accepted(self) -> None:
+        for argv in ACCEPTED:
+            with self.subTest(argv=argv):
+                expected = _argparse(argv)
+                self.assertIsNotNone(expected)
+                self.assertEqual(_parse(argv), expected)
+
+    def test_rejected(self) -> None:
+        for argv in REJECTED:
+            with self.subTest(argv=argv):
+                self.assertIsNone(_argparse(argv))
+                self.assertIsNone(_parse(argv))
+
+    def test_start_of_day_options_pass_through(self) -> None:
+        args = _parse_argv(["start-of-day", "--force"])
+        self.assertEqual(args.command, "start-of-day")
+        self.assertEqual(args.args, ["--force"])
+
+
+if __name__ == "__main__":
+    unittest.main()